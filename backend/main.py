@@ -7,29 +7,56 @@ Backend API Server
 from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, StreamingResponse
 import zipfile
-import tempfile
 import shutil
+from zipstream import ZipStream
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.middleware.cors import CORSMiddleware
 import secrets
+import csv
 import docker
 import asyncio
 import json
 import subprocess
 import os
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel
+import orjson
 import re
+import sys
+
+# uvloop speeds up every await in the app (broadcast fan-out, to_thread
+# Docker calls); it's Linux/macOS only so skip it on Windows
+if sys.platform != "win32":
+    import uvloop
+    uvloop.install()
+
+# psutil should always be installed (it's in requirements.txt) but system
+# stats degrade gracefully without it
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # Get absolute paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 TEMPLATES_DIR = BASE_DIR / "frontend" / "templates"
 STATIC_DIR = BASE_DIR / "frontend" / "static"
 
+# Workspace paths, expanded once at import instead of per request
+WORKSPACE = os.path.expanduser("~/workspaces/aquatic-mapping")
+RECON_DIR = f"{WORKSPACE}/reconstruction"
+RESULTS_ROOT = f"{RECON_DIR}/results"
+MISSIONS_DIR = f"{WORKSPACE}/src/sampling/data/missions"
+VENV_PY = f"{RECON_DIR}/venv/bin/python"
+
 app = FastAPI(title="Aquatic Mapping Control Panel")
 
 # CORS
@@ -43,6 +70,13 @@ app.add_middleware(
 
 # Templates and static files
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+
+# Reconstruction result images go through Starlette's static handler so the
+# bytes move via sendfile with range/If-Modified-Since support, instead of a
+# per-request exists+abspath+FileResponse endpoint (images are public).
+# Mounted before /static: Starlette routes by first prefix match, so the
+# shorter mount would otherwise swallow these requests
+app.mount("/static/trial-results", StaticFiles(directory=RESULTS_ROOT, check_dir=False), name="trial-results")
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # Environment detection
@@ -53,13 +87,16 @@ HOST_PC_URL = os.environ.get("HOST_PC_URL", "http://localhost:8000")  # URL to l
 USERNAME = os.environ.get("SIM_USERNAME", "bakin")
 PASSWORD = os.environ.get("SIM_PASSWORD", "ozhugu")
 
+# Pre-encoded "user\0pass" so auth is one constant-time compare per request
+# instead of two compares plus a short-circuiting `and`
+_EXPECTED_CREDENTIALS = f"{USERNAME}\0{PASSWORD}".encode()
+
 security = HTTPBasic()
 
 def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)):
     """Simple HTTP Basic Auth - browser will show popup"""
-    correct_username = secrets.compare_digest(credentials.username, USERNAME)
-    correct_password = secrets.compare_digest(credentials.password, PASSWORD)
-    if not (correct_username and correct_password):
+    given = f"{credentials.username}\0{credentials.password}".encode()
+    if not secrets.compare_digest(given, _EXPECTED_CREDENTIALS):
         raise HTTPException(
             status_code=401,
             detail="Invalid credentials",
@@ -104,24 +141,114 @@ class ReconstructionRequest(BaseModel):
 # Store for running reconstructions
 reconstruction_processes = {}
 
+# Exit codes recorded by the pidfd watcher so status checks are dict lookups
+reconstruction_exit_codes = {}
+
+# How far each trial's reconstruction.log has been read by the logs endpoint
+_log_offsets = {}
+
+def _watch_reconstruction_exit(trial_id: int, proc: subprocess.Popen):
+    """Register a pidfd so the child's exit arrives as an event loop callback.
+
+    Turns reconstruction status into a dict lookup instead of a waitpid probe
+    per request, and lets us broadcast completion the moment it happens.
+    Silently no-ops on kernels without pidfd_open; callers fall back to poll().
+    """
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        return
+    loop = asyncio.get_running_loop()
+
+    def _on_exit():
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+        proc.wait()  # child already exited, returns immediately
+        # Ignore stale callbacks from a process that was since replaced
+        if reconstruction_processes.get(trial_id) is proc:
+            reconstruction_exit_codes[trial_id] = proc.returncode
+            asyncio.ensure_future(manager.broadcast({
+                "event": "reconstruction_finished",
+                "trial_id": trial_id,
+                "return_code": proc.returncode
+            }))
+
+    loop.add_reader(pidfd, _on_exit)
+
+# Final status of reaped reconstructions so the status/logs endpoints can
+# still answer after the Popen object is dropped
+_last_status = {}
+
+async def _reaper():
+    """Periodically drop finished reconstruction processes.
+
+    reconstruction_processes only ever shrank when the same trial was
+    restarted, so finished Popen objects lingered for the life of the server
+    and every poll walked them. Move their outcome into _last_status and keep
+    the dict to actively running processes.
+    """
+    while True:
+        await asyncio.sleep(30)
+        for trial_id, proc in list(reconstruction_processes.items()):
+            if proc.poll() is not None:
+                _last_status[trial_id] = {
+                    "return_code": proc.returncode,
+                    "finished_at": time.time()
+                }
+                del reconstruction_processes[trial_id]
+                reconstruction_exit_codes.pop(trial_id, None)
+
+@app.on_event("startup")
+async def _start_reaper():
+    asyncio.create_task(_reaper())
+
+_ERROR_RE = re.compile(rb'(?i)error')
+
+def _tail_errors(path: str, max_bytes: int = 65536, max_lines: int = 5) -> str:
+    """Scan only the tail of a log file for error lines.
+
+    Bounds I/O and CPU to max_bytes regardless of log size, instead of
+    slurping a potentially multi-MB log per status poll.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - max_bytes))
+        buf = f.read()
+
+    error_lines = [line for line in buf.split(b'\n') if _ERROR_RE.search(line)]
+    return '\n'.join(line.decode('utf-8', 'replace') for line in error_lines[-max_lines:])
+
+# Fields every trial mission samples - used to probe for completed data
+EXPECTED_FIELDS = ("radial", "x_compress", "y_compress", "x_compress_tilt", "y_compress_tilt")
+
 # ============================================================================
 # Batch Manager - Continuous batch execution with auto-start
 # ============================================================================
 class BatchManager:
     def __init__(self):
         self.active_batch = None
-        self.pending_trials = []
+        # deque so the scheduler's pop-left is O(1); the set mirrors it for
+        # O(1) membership checks in mark_completed/mark_failed
+        self.pending_trials: deque[int] = deque()
+        self._pending_set: set[int] = set()
+        # Ordered lists for display, mirrored sets for O(1) duplicate checks
         self.completed_trials = []
+        self._completed_set: set[int] = set()
         self.failed_trials = []
+        self._failed_set: set[int] = set()
         self.concurrent_limit = 3
         self.running = False
         self._task = None
 
     def start_batch(self, start_trial: int, end_trial: int, concurrent: int):
         """Initialize a new batch job"""
-        self.pending_trials = list(range(start_trial, end_trial + 1))
+        self.pending_trials = deque(range(start_trial, end_trial + 1))
+        self._pending_set = set(self.pending_trials)
         self.completed_trials = []
+        self._completed_set = set()
         self.failed_trials = []
+        self._failed_set = set()
         self.concurrent_limit = concurrent
         self.active_batch = {
             "start_trial": start_trial,
@@ -133,10 +260,14 @@ class BatchManager:
         self.running = True
 
     def stop_batch(self):
-        """Cancel the active batch"""
+        """Cancel the active batch and its monitor task"""
         self.running = False
-        self.pending_trials = []
+        self.pending_trials.clear()
+        self._pending_set.clear()
         self.active_batch = None
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
 
     def get_status(self):
         """Get current batch status"""
@@ -147,7 +278,7 @@ class BatchManager:
             "active": self.running,
             "batch": self.active_batch,
             "pending": len(self.pending_trials),
-            "pending_trials": self.pending_trials[:10],  # First 10 for display
+            "pending_trials": list(islice(self.pending_trials, 10)),  # First 10 for display
             "completed": len(self.completed_trials),
             "completed_trials": self.completed_trials,
             "failed": len(self.failed_trials),
@@ -155,40 +286,86 @@ class BatchManager:
             "progress": round((len(self.completed_trials) + len(self.failed_trials)) / self.active_batch["total"] * 100, 1) if self.active_batch else 0
         }
 
+    def pop_next_pending(self) -> int:
+        """Take the next pending trial, keeping the mirror set in sync"""
+        trial_id = self.pending_trials.popleft()
+        self._pending_set.discard(trial_id)
+        return trial_id
+
     def mark_completed(self, trial_id: int):
         """Mark a trial as completed"""
-        if trial_id in self.pending_trials:
+        if trial_id in self._pending_set:
+            self._pending_set.discard(trial_id)
             self.pending_trials.remove(trial_id)
-        if trial_id not in self.completed_trials:
+        if trial_id not in self._completed_set:
+            self._completed_set.add(trial_id)
             self.completed_trials.append(trial_id)
 
     def mark_failed(self, trial_id: int):
         """Mark a trial as failed"""
-        if trial_id in self.pending_trials:
+        if trial_id in self._pending_set:
+            self._pending_set.discard(trial_id)
             self.pending_trials.remove(trial_id)
-        if trial_id not in self.failed_trials:
+        if trial_id not in self._failed_set:
+            self._failed_set.add(trial_id)
             self.failed_trials.append(trial_id)
 
 batch_manager = BatchManager()
 
 # Store for active connections
 class ConnectionManager:
+    """Fan-out with a bounded per-client queue and one writer task per socket.
+
+    broadcast() never awaits a send, so a slow client can't backpressure the
+    whole fan-out; its queue just drops the oldest frame when full.
+    """
+    QUEUE_SIZE = 64
+
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
+        self._queues: dict[WebSocket, asyncio.Queue] = {}
+        self._senders: dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, queue))
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender and not sender.done():
+            sender.cancel()
+
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one client's queue; any send failure drops the client"""
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except Exception:
+            self.disconnect(websocket)
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+        if not self._queues:
+            return
+        # Serialize once and fan out concurrently instead of awaiting each
+        # client in turn (send_json would re-serialize per client); wire
+        # compression is left to per-message deflate so the dashboard's
+        # plain JSON.parse keeps working
+        payload = orjson.dumps(message).decode()
+        for queue in list(self._queues.values()):
             try:
-                await connection.send_json(message)
-            except:
-                pass
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Slow client: discard its oldest frame to make room
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                queue.put_nowait(payload)
 
 manager = ConnectionManager()
 
@@ -212,9 +389,8 @@ async def login_page(request: Request):
 @app.post("/api/login")
 async def api_login(login: LoginRequest):
     """API login endpoint - validates credentials"""
-    correct_username = secrets.compare_digest(login.username, USERNAME)
-    correct_password = secrets.compare_digest(login.password, PASSWORD)
-    if not (correct_username and correct_password):
+    given = f"{login.username}\0{login.password}".encode()
+    if not secrets.compare_digest(given, _EXPECTED_CREDENTIALS):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     return {"success": True, "username": login.username}
 
@@ -235,8 +411,9 @@ async def dashboard(request: Request):
 @app.get("/api/status")
 async def get_status(username: str = Depends(verify_credentials)):
     """Get overall system and container status"""
-    containers = get_simulation_containers()
-    system = get_system_stats()
+    containers, system = await asyncio.gather(
+        get_simulation_containers(), get_system_stats()
+    )
     return {
         "containers": containers,
         "system": system,
@@ -248,7 +425,7 @@ async def get_status(username: str = Depends(verify_credentials)):
 @app.get("/api/containers")
 async def get_containers(username: str = Depends(verify_credentials)):
     """Get all simulation containers"""
-    return get_simulation_containers()
+    return await get_simulation_containers()
 
 @app.post("/api/trial/start/{trial_id}")
 async def start_trial(trial_id: int, username: str = Depends(verify_credentials)):
@@ -256,7 +433,7 @@ async def start_trial(trial_id: int, username: str = Depends(verify_credentials)
     if not docker_client:
         raise HTTPException(status_code=500, detail="Docker not available. Make sure Docker is running.")
     try:
-        result = start_single_trial(trial_id)
+        result = await asyncio.to_thread(start_single_trial, trial_id)
         await manager.broadcast({"event": "trial_started", "trial_id": trial_id})
         return {"success": True, "message": f"Trial {trial_id} started", "result": result}
     except Exception as e:
@@ -267,8 +444,8 @@ async def stop_trial(trial_id: int, username: str = Depends(verify_credentials))
     """Stop a running trial"""
     try:
         container_name = f"aquatic-trial-{trial_id}"
-        container = docker_client.containers.get(container_name)
-        container.stop(timeout=10)
+        container = await asyncio.to_thread(docker_client.containers.get, container_name)
+        await asyncio.to_thread(container.stop, timeout=10)
         await manager.broadcast({"event": "trial_stopped", "trial_id": trial_id})
         return {"success": True, "message": f"Trial {trial_id} stopped"}
     except docker.errors.NotFound:
@@ -281,8 +458,8 @@ async def remove_trial(trial_id: int, username: str = Depends(verify_credentials
     """Remove a trial container"""
     try:
         container_name = f"aquatic-trial-{trial_id}"
-        container = docker_client.containers.get(container_name)
-        container.remove(force=True)
+        container = await asyncio.to_thread(docker_client.containers.get, container_name)
+        await asyncio.to_thread(container.remove, force=True)
         await manager.broadcast({"event": "trial_removed", "trial_id": trial_id})
         return {"success": True, "message": f"Trial {trial_id} removed"}
     except docker.errors.NotFound:
@@ -291,66 +468,96 @@ async def remove_trial(trial_id: int, username: str = Depends(verify_credentials
         raise HTTPException(status_code=500, detail=str(e))
 
 async def batch_monitor_task():
-    """Background task that monitors containers and starts new trials as capacity becomes available"""
-    while batch_manager.running and (batch_manager.pending_trials or get_running_trial_count() > 0):
-        try:
-            containers = get_simulation_containers()
-            running_trials = [c for c in containers if c["status"] == "running"]
-            running_count = len(running_trials)
-            running_trial_ids = [c["trial_id"] for c in running_trials]
-
-            # Check for completed containers (exited but data exists)
-            for container in containers:
-                if container["status"] == "exited":
-                    trial_id = container["trial_id"]
-                    # Check if data was saved (successful completion)
-                    data_dir = os.path.expanduser(f"~/workspaces/aquatic-mapping/src/sampling/data/missions/trial_{trial_id}")
-                    if os.path.exists(data_dir) and any(f.endswith('_samples.csv') for root, dirs, files in os.walk(data_dir) for f in files):
-                        batch_manager.mark_completed(trial_id)
-                    else:
-                        batch_manager.mark_failed(trial_id)
-
-            # Start new trials if capacity is available
-            while running_count < batch_manager.concurrent_limit and batch_manager.pending_trials:
-                next_trial = batch_manager.pending_trials[0]
-                try:
-                    start_single_trial(next_trial)
-                    batch_manager.pending_trials.pop(0)  # Remove from pending after successful start
-                    running_count += 1
-                    await manager.broadcast({
-                        "event": "trial_started",
-                        "trial_id": next_trial,
-                        "batch_status": batch_manager.get_status()
-                    })
-                except Exception as e:
-                    print(f"Failed to start trial {next_trial}: {e}")
-                    batch_manager.mark_failed(next_trial)
-
-            # Broadcast batch status update
-            await manager.broadcast({
-                "event": "batch_update",
-                "batch_status": batch_manager.get_status()
-            })
-
-            # Check if batch is complete
-            if not batch_manager.pending_trials and running_count == 0:
-                batch_manager.running = False
-                await manager.broadcast({
-                    "event": "batch_complete",
-                    "batch_status": batch_manager.get_status()
-                })
+    """Background task that reacts to Docker container events instead of polling.
+
+    Consumes the daemon's event stream in a worker thread and re-evaluates the
+    batch whenever a trial container dies, so there is no idle-polling and
+    reaction latency is bounded by event delivery instead of a sleep interval.
+    """
+    loop = asyncio.get_running_loop()
+    events = docker_client.events(
+        decode=True,
+        filters={"type": "container", "event": "die", "label": "trial_id"}
+    )
+    try:
+        # Evaluate once up front in case containers exited before we attached
+        running_count = await process_batch_state()
+
+        while batch_manager.running and (
+            running_count is None or batch_manager.pending_trials or running_count > 0
+        ):
+            event = await loop.run_in_executor(None, next, events, None)
+            if event is None:
                 break
+            running_count = await process_batch_state()
+    finally:
+        events.close()
+
+async def process_batch_state():
+    """Mark finished trials, start pending ones up to the concurrent limit, broadcast status.
+
+    Fetches one container snapshot and reuses it for the whole evaluation,
+    so each pass costs a single Docker API listing. Returns the running count.
+    """
+    running_count = 0
+    pending_events = []
+    try:
+        containers = await get_simulation_containers()
+        running_trials = [c for c in containers if c["status"] == "running"]
+        running_count = len(running_trials)
+
+        # Check for completed containers (exited but data exists)
+        for container in containers:
+            if container["status"] == "exited":
+                trial_id = container["trial_id"]
+                # Check if data was saved (successful completion)
+                data_dir = f"{MISSIONS_DIR}/trial_{trial_id}"
+                if any(os.path.exists(f"{data_dir}/{field}/{field}_samples.csv") for field in EXPECTED_FIELDS):
+                    batch_manager.mark_completed(trial_id)
+                else:
+                    batch_manager.mark_failed(trial_id)
+
+        # Start new trials if capacity is available
+        while running_count < batch_manager.concurrent_limit and batch_manager.pending_trials:
+            next_trial = batch_manager.pop_next_pending()
+            try:
+                # containers.run is the heaviest Docker call here (seconds,
+                # possibly an image pull) - keep it off the event loop
+                await asyncio.to_thread(start_single_trial, next_trial)
+                running_count += 1
+            except Exception as e:
+                print(f"Failed to start trial {next_trial}: {e}")
+                batch_manager.mark_failed(next_trial)
+                continue
+            pending_events.append({"event": "trial_started", "trial_id": next_trial})
 
-        except Exception as e:
-            print(f"Batch monitor error: {e}")
+        # Build the status dict once per tick and reuse it in every broadcast
+        # instead of re-calling get_status() per event
+        status_snapshot = batch_manager.get_status()
 
-        await asyncio.sleep(5)  # Check every 5 seconds
+        pending_events.append({"event": "batch_update"})
 
-def get_running_trial_count():
-    """Get count of running trial containers"""
-    if not docker_client:
-        return 0
-    return len([c for c in get_simulation_containers() if c["status"] == "running"])
+        # Check if batch is complete
+        if not batch_manager.pending_trials and running_count == 0:
+            batch_manager.running = False
+            status_snapshot["active"] = False
+            pending_events.append({"event": "batch_complete"})
+
+        # Coalesce the tick's events into one frame per client instead of a
+        # separate WebSocket message (and frame overhead) per event
+        await manager.broadcast({
+            "events": pending_events,
+            "batch_status": status_snapshot
+        })
+
+    except Exception as e:
+        print(f"Batch monitor error: {e}")
+        # Evaluation failed (e.g. transient Docker error) - don't report a
+        # phantom zero count that would make the monitor think the batch is
+        # done; None keeps the loop alive so the next event retries
+        return None
+
+    return running_count
 
 @app.post("/api/batch/start")
 async def start_batch(batch: BatchRequest, background_tasks=None, username: str = Depends(verify_credentials)):
@@ -366,22 +573,25 @@ async def start_batch(batch: BatchRequest, background_tasks=None, username: str
         # Initialize batch manager
         batch_manager.start_batch(batch.start_trial, batch.end_trial, batch.concurrent)
 
-        # Start initial trials up to concurrent limit
+        # Start initial trials up to concurrent limit (daemon filters to running)
         started = []
-        running_count = get_running_trial_count()
+        running_count = len(await get_simulation_containers(status="running"))
 
         while running_count < batch.concurrent and batch_manager.pending_trials:
-            next_trial = batch_manager.pending_trials.pop(0)
+            next_trial = batch_manager.pop_next_pending()
             try:
-                start_single_trial(next_trial)
+                await asyncio.to_thread(start_single_trial, next_trial)
                 started.append(next_trial)
                 running_count += 1
             except Exception as e:
                 batch_manager.mark_failed(next_trial)
                 print(f"Failed to start trial {next_trial}: {e}")
 
-        # Start background monitoring task
-        asyncio.create_task(batch_monitor_task())
+        # Start background monitoring task, cancelling any leftover monitor
+        # so two tasks never poll Docker for the same batch
+        if batch_manager._task and not batch_manager._task.done():
+            batch_manager._task.cancel()
+        batch_manager._task = asyncio.create_task(batch_monitor_task())
 
         await manager.broadcast({
             "event": "batch_started",
@@ -419,10 +629,13 @@ async def stop_all(username: str = Depends(verify_credentials)):
         batch_manager.stop_batch()
 
         stopped = []
-        for container in docker_client.containers.list():
-            if container.name.startswith("aquatic-trial-"):
-                container.stop(timeout=10)
-                stopped.append(container.name)
+        # Let the daemon filter by label instead of fetching every container
+        trial_containers = await asyncio.to_thread(
+            docker_client.containers.list, filters={"label": "app=aquatic-trial"}
+        )
+        for container in trial_containers:
+            await asyncio.to_thread(container.stop, timeout=10)
+            stopped.append(container.name)
 
         await manager.broadcast({"event": "batch_stopped", "containers": stopped})
         return {"success": True, "stopped": stopped}
@@ -432,35 +645,39 @@ async def stop_all(username: str = Depends(verify_credentials)):
 @app.get("/api/system")
 async def get_system(username: str = Depends(verify_credentials)):
     """Get system resource usage"""
-    return get_system_stats()
+    return await get_system_stats()
 
 @app.get("/api/trials/completed")
 async def get_completed_trials(username: str = Depends(verify_credentials)):
     """Get list of completed trials with data"""
-    data_dir = os.path.expanduser("~/workspaces/aquatic-mapping/src/sampling/data/missions")
+    data_dir = MISSIONS_DIR
     trials = []
 
+    # scandir returns DirEntry objects with cached type/stat info, so this
+    # avoids the extra stat syscalls a listdir+isdir+getsize chain would pay
     if os.path.exists(data_dir):
-        for item in os.listdir(data_dir):
-            if item.startswith("trial_"):
-                trial_path = os.path.join(data_dir, item)
-                if os.path.isdir(trial_path):
-                    trial_id = item.replace("trial_", "")
-                    fields = []
-                    for field in os.listdir(trial_path):
-                        field_path = os.path.join(trial_path, field)
-                        if os.path.isdir(field_path):
-                            csv_file = os.path.join(field_path, f"{field}_samples.csv")
-                            if os.path.exists(csv_file):
-                                size = os.path.getsize(csv_file)
-                                fields.append({"name": field, "size": size})
-
-                    trials.append({
-                        "id": trial_id,
-                        "path": trial_path,
-                        "fields": fields,
-                        "field_count": len(fields)
-                    })
+        with os.scandir(data_dir) as trial_it:
+            for trial_entry in trial_it:
+                if not trial_entry.name.startswith("trial_") or not trial_entry.is_dir(follow_symlinks=False):
+                    continue
+                trial_id = trial_entry.name.replace("trial_", "")
+                fields = []
+                with os.scandir(trial_entry.path) as field_it:
+                    for field_entry in field_it:
+                        if not field_entry.is_dir(follow_symlinks=False):
+                            continue
+                        try:
+                            csv_stat = os.stat(f"{field_entry.path}/{field_entry.name}_samples.csv")
+                        except FileNotFoundError:
+                            continue
+                        fields.append({"name": field_entry.name, "size": csv_stat.st_size})
+
+                trials.append({
+                    "id": trial_id,
+                    "path": trial_entry.path,
+                    "fields": fields,
+                    "field_count": len(fields)
+                })
 
     return sorted(trials, key=lambda x: int(x["id"]) if x["id"].isdigit() else 0)
 
@@ -469,8 +686,8 @@ async def get_trial_logs(trial_id: int, lines: int = 100, username: str = Depend
     """Get logs from a trial container"""
     try:
         container_name = f"aquatic-trial-{trial_id}"
-        container = docker_client.containers.get(container_name)
-        logs = container.logs(tail=lines).decode('utf-8')
+        container = await asyncio.to_thread(docker_client.containers.get, container_name)
+        logs = (await asyncio.to_thread(container.logs, tail=lines)).decode('utf-8')
         return {"trial_id": trial_id, "logs": logs}
     except docker.errors.NotFound:
         raise HTTPException(status_code=404, detail=f"Trial {trial_id} not found")
@@ -478,76 +695,68 @@ async def get_trial_logs(trial_id: int, lines: int = 100, username: str = Depend
 @app.get("/api/download/{trial_id}")
 async def download_trial_data(trial_id: int, username: str = Depends(verify_credentials)):
     """Download trial data as ZIP file"""
-    data_dir = os.path.expanduser("~/workspaces/aquatic-mapping/src/sampling/data/missions")
+    data_dir = MISSIONS_DIR
     trial_path = os.path.join(data_dir, f"trial_{trial_id}")
 
     if not os.path.exists(trial_path):
         raise HTTPException(status_code=404, detail=f"Trial {trial_id} data not found")
 
-    # Create ZIP file
+    # Stream the ZIP as it's built - no tempfile, constant memory, and the
+    # first bytes go out as soon as the first file is compressed
     zip_filename = f"trial_{trial_id}_data.zip"
-    zip_path = os.path.join(tempfile.gettempdir(), zip_filename)
-
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(trial_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, trial_path)
-                zipf.write(file_path, arcname)
+    zs = ZipStream(compress_type=zipfile.ZIP_DEFLATED)
+    for entry in os.scandir(trial_path):
+        zs.add_path(entry.path)
 
-    return FileResponse(
-        zip_path,
+    return StreamingResponse(
+        zs,
         media_type='application/zip',
-        filename=zip_filename,
         headers={"Content-Disposition": f"attachment; filename={zip_filename}"}
     )
 
 @app.get("/api/trial/{trial_id}/data")
 async def get_trial_data_preview(trial_id: int, field: str = "radial", username: str = Depends(verify_credentials)):
     """Get preview of trial CSV data"""
-    data_dir = os.path.expanduser("~/workspaces/aquatic-mapping/src/sampling/data/missions")
+    data_dir = MISSIONS_DIR
     csv_path = os.path.join(data_dir, f"trial_{trial_id}", field, f"{field}_samples.csv")
 
     if not os.path.exists(csv_path):
         raise HTTPException(status_code=404, detail=f"Data not found for trial {trial_id}, field {field}")
 
-    import csv
-    rows = []
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            if i >= 100:  # Limit to first 100 rows
-                break
-            rows.append(row)
+    def read_preview():
+        # Plain reader + islice beats DictReader here: we only materialize
+        # the 100 preview rows and zip the header once per row
+        with open(csv_path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            return [dict(zip(header, row)) for row in islice(reader, 100)]
+
+    rows = await asyncio.to_thread(read_preview)
 
     return {"trial_id": trial_id, "field": field, "rows": rows, "total_preview": len(rows)}
 
 @app.delete("/api/trial/{trial_id}/data")
 async def delete_trial_data(trial_id: int, username: str = Depends(verify_credentials)):
     """Delete trial data and reconstruction results"""
-    data_dir = os.path.expanduser("~/workspaces/aquatic-mapping/src/sampling/data/missions")
+    data_dir = MISSIONS_DIR
     trial_data_path = os.path.join(data_dir, f"trial_{trial_id}")
 
-    results_dir = os.path.expanduser("~/workspaces/aquatic-mapping/reconstruction/results")
+    results_dir = RESULTS_ROOT
     trial_results_path = os.path.join(results_dir, f"trial_{trial_id}")
 
     deleted = []
     errors = []
 
+    def _on_rm_error(func, path, exc_info):
+        # Files created by Docker may have different ownership - chmod only
+        # the path that failed and retry, instead of pre-chmodding the tree
+        os.chmod(path, 0o700)
+        func(path)
+
     # Delete trial data
     if os.path.exists(trial_data_path):
         try:
-            # Try to fix permissions first (files created by Docker may have different ownership)
-            try:
-                for root, dirs, files in os.walk(trial_data_path):
-                    for d in dirs:
-                        os.chmod(os.path.join(root, d), 0o755)
-                    for f in files:
-                        os.chmod(os.path.join(root, f), 0o644)
-            except:
-                pass  # Ignore permission change errors, will try deletion anyway
-
-            shutil.rmtree(trial_data_path)
+            await asyncio.to_thread(shutil.rmtree, trial_data_path, onerror=_on_rm_error)
             deleted.append(f"trial data ({trial_data_path})")
         except PermissionError as e:
             errors.append(f"Permission denied deleting trial data. Files may be owned by Docker. Try: sudo rm -rf {trial_data_path}")
@@ -557,7 +766,7 @@ async def delete_trial_data(trial_id: int, username: str = Depends(verify_creden
     # Delete reconstruction results
     if os.path.exists(trial_results_path):
         try:
-            shutil.rmtree(trial_results_path)
+            await asyncio.to_thread(shutil.rmtree, trial_results_path)
             deleted.append(f"reconstruction results ({trial_results_path})")
         except Exception as e:
             errors.append(f"Failed to delete reconstruction results: {str(e)}")
@@ -572,6 +781,7 @@ async def delete_trial_data(trial_id: int, username: str = Depends(verify_creden
             except:
                 proc.kill()
         del reconstruction_processes[trial_id]
+        reconstruction_exit_codes.pop(trial_id, None)
         deleted.append("running reconstruction process")
 
     if not deleted and not errors:
@@ -591,12 +801,10 @@ async def delete_trial_data(trial_id: int, username: str = Depends(verify_creden
 @app.post("/api/reconstruct/{trial_id}")
 async def start_reconstruction(trial_id: int, request: ReconstructionRequest, username: str = Depends(verify_credentials)):
     """Start GP reconstruction for a trial"""
-    reconstruction_dir = os.path.expanduser("~/workspaces/aquatic-mapping/reconstruction")
-    venv_python = os.path.join(reconstruction_dir, "venv", "bin", "python")
-    script_path = os.path.join(reconstruction_dir, "run_reconstruction.py")
+    script_path = f"{RECON_DIR}/run_reconstruction.py"
 
     # Check if trial data exists
-    data_dir = os.path.expanduser("~/workspaces/aquatic-mapping/src/sampling/data/missions")
+    data_dir = MISSIONS_DIR
     trial_path = os.path.join(data_dir, f"trial_{trial_id}")
 
     if not os.path.exists(trial_path):
@@ -606,34 +814,44 @@ async def start_reconstruction(trial_id: int, request: ReconstructionRequest, us
     if trial_id in reconstruction_processes:
         proc = reconstruction_processes[trial_id]
         if proc.poll() is None:  # Still running
-            # Kill the old one and start fresh
+            # Kill the old one and start fresh; the wait happens in a worker
+            # thread so a slow-dying process doesn't stall the event loop
             proc.terminate()
             try:
-                proc.wait(timeout=5)
-            except:
+                await asyncio.wait_for(asyncio.to_thread(proc.wait), timeout=5.0)
+            except asyncio.TimeoutError:
                 proc.kill()
+                await asyncio.to_thread(proc.wait)
         # Remove from dict either way
         del reconstruction_processes[trial_id]
 
     try:
         # Build command - always run all fields and all methods
-        cmd = [venv_python, script_path, "all", str(trial_id), "all"]
+        cmd = [VENV_PY, script_path, "all", str(trial_id), "all"]
 
         # Create results directory and log file for output
-        results_dir = os.path.expanduser(f"~/workspaces/aquatic-mapping/reconstruction/results/trial_{trial_id}")
+        results_dir = f"{RESULTS_ROOT}/trial_{trial_id}"
         os.makedirs(results_dir, exist_ok=True)
         log_file = os.path.join(results_dir, "reconstruction.log")
+        _log_offsets.pop(trial_id, None)
+        _last_status.pop(trial_id, None)
+        # A re-run overwrites metrics CSVs deep in the tree without touching
+        # the results dir's own mtime, so the mtime-keyed cache must be
+        # dropped explicitly (lru_cache has no per-key invalidation)
+        _load_reconstruction_results.cache_clear()
 
         # Start reconstruction process in background, writing to log file
         with open(log_file, 'w') as log_f:
             proc = subprocess.Popen(
                 cmd,
-                cwd=reconstruction_dir,
+                cwd=RECON_DIR,
                 stdout=log_f,
                 stderr=subprocess.STDOUT,
                 text=True
             )
         reconstruction_processes[trial_id] = proc
+        reconstruction_exit_codes.pop(trial_id, None)
+        _watch_reconstruction_exit(trial_id, proc)
 
         await manager.broadcast({
             "event": "reconstruction_started",
@@ -652,102 +870,148 @@ async def start_reconstruction(trial_id: int, request: ReconstructionRequest, us
 @app.get("/api/reconstruct/{trial_id}/status")
 async def get_reconstruction_status(trial_id: int, username: str = Depends(verify_credentials)):
     """Get reconstruction status for a trial"""
-    if trial_id not in reconstruction_processes:
-        return {"running": False, "message": "No reconstruction process found"}
-
-    proc = reconstruction_processes[trial_id]
-    if proc.poll() is None:
-        return {"running": True, "message": "Reconstruction in progress", "pid": proc.pid}
+    proc = reconstruction_processes.get(trial_id)
+    if proc is None:
+        # The reaper may have already moved a finished run to _last_status
+        last = _last_status.get(trial_id)
+        if last is None:
+            return {"running": False, "message": "No reconstruction process found"}
+        return_code = last["return_code"]
     else:
-        # Process finished - check if it succeeded or failed
-        return_code = proc.returncode
-        status = {
-            "running": False,
-            "return_code": return_code,
-            "success": return_code == 0
-        }
+        # The pidfd watcher records the exit code as soon as the child dies;
+        # poll() is only the fallback when pidfd_open isn't available
+        return_code = reconstruction_exit_codes.get(trial_id)
+        if return_code is None and proc.poll() is None:
+            return {"running": True, "message": "Reconstruction in progress", "pid": proc.pid}
+        if return_code is None:
+            return_code = proc.returncode
+
+    # Process finished - check if it succeeded or failed
+    status = {
+        "running": False,
+        "return_code": return_code,
+        "success": return_code == 0
+    }
 
-        # If failed, try to read error from log
-        if return_code != 0:
-            log_file = os.path.expanduser(f"~/workspaces/aquatic-mapping/reconstruction/results/trial_{trial_id}/reconstruction.log")
-            if os.path.exists(log_file):
-                try:
-                    with open(log_file, 'r') as f:
-                        log_content = f.read()
-                        # Extract error messages
-                        error_lines = [line for line in log_content.split('\n') if 'ERROR' in line or 'error' in line.lower()]
-                        if error_lines:
-                            status["error"] = '\n'.join(error_lines[-5:])  # Last 5 error lines
-                        else:
-                            status["error"] = "Reconstruction failed. Check logs for details."
-                        status["message"] = "Reconstruction failed"
-                except:
-                    status["message"] = "Reconstruction failed"
-                    status["error"] = "Could not read error log"
-            else:
+    # If failed, try to read error from log
+    if return_code != 0:
+        log_file = f"{RESULTS_ROOT}/trial_{trial_id}/reconstruction.log"
+        if os.path.exists(log_file):
+            try:
+                error_tail = _tail_errors(log_file)
+                if error_tail:
+                    status["error"] = error_tail
+                else:
+                    status["error"] = "Reconstruction failed. Check logs for details."
+                status["message"] = "Reconstruction failed"
+            except:
                 status["message"] = "Reconstruction failed"
-                status["error"] = "No log file found"
+                status["error"] = "Could not read error log"
         else:
-            status["message"] = "Reconstruction completed successfully"
+            status["message"] = "Reconstruction failed"
+            status["error"] = "No log file found"
+    else:
+        status["message"] = "Reconstruction completed successfully"
+
+    return status
+
+@lru_cache(maxsize=128)
+def _load_reconstruction_results(trial_id: int, mtime_key: int):
+    """Aggregate metrics CSVs for a trial, cached per results-dir mtime.
+
+    mtime_key exists purely to invalidate the cache when reconstruction
+    re-runs; warm requests skip the directory scan and CSV parsing.
+    """
+    results_dir = f"{RESULTS_ROOT}/trial_{trial_id}"
+    results = []
+
+    # Walk method/field/kernel dirs that actually exist instead of probing
+    # all 60 combinations - partial runs only touch the dirs they produced
+    combos = []
+    try:
+        with os.scandir(results_dir) as methods_it:
+            method_dirs = [e for e in methods_it if e.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        method_dirs = []
+    for method_entry in method_dirs:
+        with os.scandir(method_entry.path) as fields_it:
+            field_dirs = [e for e in fields_it if e.is_dir(follow_symlinks=False)]
+        for field_entry in field_dirs:
+            with os.scandir(field_entry.path) as kernels_it:
+                for kernel_entry in kernels_it:
+                    if kernel_entry.is_dir(follow_symlinks=False):
+                        combos.append((method_entry.name, field_entry.name, kernel_entry.name, kernel_entry.path))
+
+    for method, field, kernel, kernel_path in sorted(combos):
+        metrics_path = os.path.join(kernel_path, f"{field}_{kernel}_metrics.csv")
+        # Open directly; the except replaces a separate exists() stat
+        try:
+            f = open(metrics_path, newline='')
+        except FileNotFoundError:
+            continue
+        with f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            rmse_idx = header.index('rmse') if 'rmse' in header else None
+            nrmse_idx = header.index('nrmse') if 'nrmse' in header else None
+            for row in reader:
+                results.append({
+                    "method": method,
+                    "field": field,
+                    "kernel": kernel,
+                    "rmse": float(row[rmse_idx]) if rmse_idx is not None else 0.0,
+                    "nrmse": float(row[nrmse_idx]) if nrmse_idx is not None else 0.0
+                })
 
-        return status
+    # Sort by field, then method, then kernel
+    results.sort(key=lambda x: (x['field'], x['method'], x['kernel']))
+
+    return tuple(results)
 
 @app.get("/api/reconstruct/{trial_id}/results")
 async def get_reconstruction_results(trial_id: int, username: str = Depends(verify_credentials)):
     """Get reconstruction results (metrics) for a trial"""
-    results_dir = os.path.expanduser(f"~/workspaces/aquatic-mapping/reconstruction/results/trial_{trial_id}")
+    results_dir = f"{RESULTS_ROOT}/trial_{trial_id}"
 
-    if not os.path.exists(results_dir):
+    try:
+        mtime_key = os.stat(results_dir).st_mtime_ns
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"No reconstruction results for trial {trial_id}")
 
-    results = []
-    fields = ['radial', 'x_compress', 'y_compress', 'x_compress_tilt', 'y_compress_tilt']
-    methods = ['standard_gp', 'mchutchon_nigp', 'girard']
-    kernels = ['rbf', 'exponential', 'matern15', 'matern25']
-
-    for method in methods:
-        for field in fields:
-            for kernel in kernels:
-                # Girard only supports RBF
-                if method == 'girard' and kernel != 'rbf':
-                    continue
+    # The dir's own mtime only moves when an immediate child appears; a
+    # re-run rewrites CSVs deeper in the tree, but it also rewrites the log,
+    # so fold the log mtime into the key to catch that case
+    try:
+        mtime_key = max(mtime_key, os.stat(f"{results_dir}/reconstruction.log").st_mtime_ns)
+    except FileNotFoundError:
+        pass
 
-                metrics_path = os.path.join(results_dir, method, field, kernel, f"{field}_{kernel}_metrics.csv")
-                if os.path.exists(metrics_path):
-                    import csv
-                    with open(metrics_path, 'r') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            results.append({
-                                "method": method,
-                                "field": field,
-                                "kernel": kernel,
-                                "rmse": float(row.get('rmse', 0)),
-                                "nrmse": float(row.get('nrmse', 0))
-                            })
+    results = _load_reconstruction_results(trial_id, mtime_key)
 
-    # Sort by field, then method, then kernel
-    results.sort(key=lambda x: (x['field'], x['method'], x['kernel']))
-
-    return {"trial_id": trial_id, "results": results}
+    return {"trial_id": trial_id, "results": list(results)}
 
 @app.get("/api/reconstruct/{trial_id}/logs")
 async def get_reconstruction_logs(trial_id: int, username: str = Depends(verify_credentials)):
     """Get reconstruction output logs"""
-    if trial_id not in reconstruction_processes:
+    proc = reconstruction_processes.get(trial_id)
+    if proc is not None:
+        running = proc.poll() is None
+    elif trial_id in _last_status:
+        running = False
+    else:
         return {"logs": "", "running": False}
 
-    proc = reconstruction_processes[trial_id]
-    running = proc.poll() is None
-
-    # Try to read available output (non-blocking)
+    # Process output goes to reconstruction.log, not a pipe - tail the file
+    # from where the previous call left off so each poll only returns new lines
+    log_file = f"{RESULTS_ROOT}/trial_{trial_id}/reconstruction.log"
     logs = ""
     try:
-        if proc.stdout:
-            import select
-            if select.select([proc.stdout], [], [], 0)[0]:
-                logs = proc.stdout.read()
-    except:
+        with open(log_file, 'rb') as f:
+            f.seek(_log_offsets.get(trial_id, 0))
+            chunk = f.read()
+            _log_offsets[trial_id] = f.tell()
+        logs = chunk.decode('utf-8', 'replace')
+    except FileNotFoundError:
         pass
 
     return {"logs": logs, "running": running}
@@ -755,62 +1019,69 @@ async def get_reconstruction_logs(trial_id: int, username: str = Depends(verify_
 @app.get("/api/reconstruct/{trial_id}/images")
 async def get_reconstruction_images(trial_id: int, username: str = Depends(verify_credentials)):
     """Get list of reconstruction result images"""
-    results_dir = os.path.expanduser(f"~/workspaces/aquatic-mapping/reconstruction/results/trial_{trial_id}")
+    results_dir = f"{RESULTS_ROOT}/trial_{trial_id}"
 
     if not os.path.exists(results_dir):
         return {"images": []}
 
-    images = []
-    for root, dirs, files in os.walk(results_dir):
-        for file in files:
-            if file.endswith('.png'):
-                rel_path = os.path.relpath(os.path.join(root, file), results_dir)
-                images.append({
-                    "name": file,
-                    "path": rel_path,
-                    "url": f"/api/reconstruct/{trial_id}/image/{rel_path}"
-                })
+    # Manual DFS over scandir: DirEntry type checks come from the directory
+    # read itself, so no per-entry stat like os.walk, and rel paths are a
+    # string slice rather than os.path.relpath (which calls getcwd)
+    def _collect(base):
+        images = []
+        prefix_len = len(base) + 1
+        stack = [base]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.png'):
+                        rel_path = entry.path[prefix_len:]
+                        images.append({
+                            "name": entry.name,
+                            "path": rel_path,
+                            "url": f"/static/trial-results/trial_{trial_id}/{rel_path}"
+                        })
+        return images
+
+    # The walk is all disk I/O - run it off the event loop
+    images = await asyncio.to_thread(_collect, results_dir)
 
     return {"trial_id": trial_id, "images": images}
 
 @app.get("/api/reconstruct/{trial_id}/image/{image_path:path}")
 async def get_reconstruction_image(trial_id: int, image_path: str):
-    """Serve a reconstruction result image (no auth - public images)"""
-    results_dir = os.path.expanduser(f"~/workspaces/aquatic-mapping/reconstruction/results/trial_{trial_id}")
-    full_path = os.path.join(results_dir, image_path)
-
-    # Security check - ensure path is within results dir
-    if not os.path.abspath(full_path).startswith(os.path.abspath(results_dir)):
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    if not os.path.exists(full_path):
-        raise HTTPException(status_code=404, detail="Image not found")
-
-    return FileResponse(full_path, media_type="image/png")
+    """Legacy image URL - redirect to the static mount (no auth - public images)"""
+    return RedirectResponse(url=f"/static/trial-results/trial_{trial_id}/{image_path}")
 
 @app.post("/api/reconstruct/{trial_id}/generate-heatmap")
 async def generate_comparison_heatmap(trial_id: int, username: str = Depends(verify_credentials)):
     """Generate comparison heatmap for a trial"""
-    reconstruction_dir = os.path.expanduser("~/workspaces/aquatic-mapping/reconstruction")
-    venv_python = os.path.join(reconstruction_dir, "venv", "bin", "python")
-    script_path = os.path.join(reconstruction_dir, "compare_all_methods.py")
+    script_path = f"{RECON_DIR}/compare_all_methods.py"
 
     # Check if trial results exist
-    results_dir = os.path.expanduser(f"~/workspaces/aquatic-mapping/reconstruction/results/trial_{trial_id}")
+    results_dir = f"{RESULTS_ROOT}/trial_{trial_id}"
     if not os.path.exists(results_dir):
         raise HTTPException(status_code=404, detail=f"No reconstruction results for trial {trial_id}")
 
     try:
-        # Run the comparison script
-        result = subprocess.run(
-            [venv_python, script_path, str(trial_id)],
-            cwd=reconstruction_dir,
-            capture_output=True,
-            text=True,
-            timeout=30
+        # Run the comparison script without blocking the event loop - other
+        # requests and WebSocket ticks keep flowing while it works
+        proc = await asyncio.create_subprocess_exec(
+            VENV_PY, script_path, str(trial_id),
+            cwd=RECON_DIR,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise HTTPException(status_code=500, detail="Heatmap generation timed out")
 
-        if result.returncode == 0:
+        if proc.returncode == 0:
             # Check if heatmap was created
             heatmap_path = os.path.join(results_dir, "comparison", "comparison_heatmaps.png")
             if os.path.exists(heatmap_path):
@@ -823,16 +1094,16 @@ async def generate_comparison_heatmap(trial_id: int, username: str = Depends(ver
                 return {
                     "success": False,
                     "message": "Heatmap script completed but no image was created",
-                    "output": result.stdout
+                    "output": stdout.decode('utf-8', 'replace')
                 }
         else:
             return {
                 "success": False,
                 "message": "Failed to generate heatmap",
-                "error": result.stderr or result.stdout
+                "error": stderr.decode('utf-8', 'replace') or stdout.decode('utf-8', 'replace')
             }
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=500, detail="Heatmap generation timed out")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -840,6 +1111,44 @@ async def generate_comparison_heatmap(trial_id: int, username: str = Depends(ver
 # Host VNC Control Routes (x11vnc + noVNC for web access)
 # ============================================================================
 
+# TTL cache so high-rate UI status polls don't fork pgrep four times a hit
+_vnc_status_cache = {"t": 0.0, "val": (False, False)}
+
+def _vnc_status():
+    """Return (x11vnc_running, novnc_running), cached for 1 second.
+
+    One psutil process scan replaces the four pgrep fork+execs the VNC
+    endpoints used to pay per call.
+    """
+    if psutil is None:
+        return (False, False)
+
+    now = time.monotonic()
+    if now - _vnc_status_cache["t"] < 1.0:
+        return _vnc_status_cache["val"]
+
+    x11vnc_running = False
+    novnc_running = False
+    for proc in psutil.process_iter(['cmdline']):
+        try:
+            cmdline = ' '.join(proc.info['cmdline'] or [])
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        if 'x11vnc' in cmdline and '-rfbport 5900' in cmdline:
+            x11vnc_running = True
+        elif 'websockify' in cmdline and '6080' in cmdline:
+            novnc_running = True
+        if x11vnc_running and novnc_running:
+            break
+
+    _vnc_status_cache["t"] = now
+    _vnc_status_cache["val"] = (x11vnc_running, novnc_running)
+    return _vnc_status_cache["val"]
+
+def _invalidate_vnc_status():
+    """Drop the cached status after starting/stopping the services"""
+    _vnc_status_cache["t"] = 0.0
+
 @app.post("/api/host/vnc/start")
 async def start_host_vnc(username: str = Depends(verify_credentials)):
     """Start VNC server with noVNC web access for remote desktop"""
@@ -847,10 +1156,7 @@ async def start_host_vnc(username: str = Depends(verify_credentials)):
     start_script = os.path.join(scripts_dir, "start-remote-desktop.sh")
 
     # Check if services are already running
-    x11vnc_running = subprocess.run(["pgrep", "-f", "x11vnc.*-rfbport 5900"],
-                                     capture_output=True).returncode == 0
-    novnc_running = subprocess.run(["pgrep", "-f", "websockify.*6080"],
-                                    capture_output=True).returncode == 0
+    x11vnc_running, novnc_running = _vnc_status()
 
     if x11vnc_running and novnc_running:
         return {
@@ -900,6 +1206,8 @@ async def start_host_vnc(username: str = Depends(verify_credentials)):
             novnc_cmd = ["websockify", "--web=/usr/share/novnc/", "6080", "localhost:5900"]
             subprocess.Popen(novnc_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
+        _invalidate_vnc_status()
+
         return {
             "success": True,
             "message": "Remote desktop started",
@@ -930,15 +1238,14 @@ async def stop_host_vnc(username: str = Depends(verify_credentials)):
         subprocess.run(["pkill", "-f", "x11vnc.*-rfbport 5900"], capture_output=True)
         subprocess.run(["pkill", "-f", "websockify.*6080"], capture_output=True)
 
+    _invalidate_vnc_status()
+
     return {"success": True, "message": "Remote desktop stopped"}
 
 @app.get("/api/host/vnc/status")
 async def get_host_vnc_status(username: str = Depends(verify_credentials)):
     """Get host VNC and noVNC server status"""
-    x11vnc_running = subprocess.run(["pgrep", "-f", "x11vnc.*-rfbport 5900"],
-                                     capture_output=True).returncode == 0
-    novnc_running = subprocess.run(["pgrep", "-f", "websockify.*6080"],
-                                    capture_output=True).returncode == 0
+    x11vnc_running, novnc_running = _vnc_status()
 
     return {
         "x11vnc_running": x11vnc_running,
@@ -953,15 +1260,19 @@ async def get_host_vnc_status(username: str = Depends(verify_credentials)):
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
+    last_digest = None
     try:
         while True:
-            # Send status update every 2 seconds
-            status = {
-                "containers": get_simulation_containers(),
-                "system": get_system_stats(),
-                "timestamp": datetime.now().isoformat()
-            }
-            await websocket.send_json(status)
+            # Sample every 2 seconds but only push frames whose content
+            # actually changed - idle dashboards cost no socket writes
+            containers, system = await asyncio.gather(
+                get_simulation_containers(), get_system_stats()
+            )
+            payload = orjson.dumps({"containers": containers, "system": system})
+            digest = hash(payload)
+            if digest != last_digest:
+                await websocket.send_text(payload.decode())
+                last_digest = digest
             await asyncio.sleep(2)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -970,8 +1281,13 @@ async def websocket_endpoint(websocket: WebSocket):
 # Helper Functions
 # ============================================================================
 
-def parse_mission_progress(logs: str) -> dict:
-    """Parse container logs to extract mission progress"""
+# Compiled once; logs stay as bytes so the per-tick parse skips the decode
+_WAYPOINT_RE = re.compile(rb'Waypoint (\d+)/(\d+):')
+_WAYPOINT_MARKER = b'Waypoint '
+_MISSION_COMPLETE_MARKER = b'MISSION COMPLETE!'
+
+def parse_mission_progress(logs: bytes) -> dict:
+    """Parse container logs (raw bytes) to extract mission progress"""
     progress = {
         "current_waypoint": 0,
         "total_waypoints": 0,
@@ -979,46 +1295,96 @@ def parse_mission_progress(logs: str) -> dict:
         "progress_percent": 0
     }
 
-    # Find the latest waypoint progress line
+    # Find the latest waypoint progress line by scanning back from the end -
+    # only the last match matters, so don't materialize all of them. Keep
+    # stepping back past "Waypoint " occurrences that aren't progress lines
+    # so stray log text can't hide an earlier valid match
     # Format: "Waypoint 5/25: (x, y)"
-    waypoint_matches = re.findall(r'Waypoint (\d+)/(\d+):', logs)
-    if waypoint_matches:
-        last_match = waypoint_matches[-1]
-        progress["current_waypoint"] = int(last_match[0])
-        progress["total_waypoints"] = int(last_match[1])
-        progress["progress_percent"] = round((int(last_match[0]) / int(last_match[1])) * 100, 1)
+    idx = logs.rfind(_WAYPOINT_MARKER)
+    match = None
+    while idx >= 0:
+        match = _WAYPOINT_RE.match(logs, idx)
+        if match:
+            break
+        idx = logs.rfind(_WAYPOINT_MARKER, 0, idx)
+    if match:
+        current, total = int(match.group(1)), int(match.group(2))
+        progress["current_waypoint"] = current
+        progress["total_waypoints"] = total
+        progress["progress_percent"] = round((current / total) * 100, 1)
 
     # Check if mission is complete
-    if 'MISSION COMPLETE!' in logs:
+    if _MISSION_COMPLETE_MARKER in logs:
         progress["mission_complete"] = True
         progress["progress_percent"] = 100
 
     return progress
 
-def get_simulation_containers():
-    """Get all simulation containers and their status"""
+# Previous (cpu_total, system_cpu) sample per container id - one-shot stats
+# carry no precpu_stats, so CPU% is computed across successive ticks
+_prev_stats = {}
+
+async def get_simulation_containers(trial_ids=None, status=None):
+    """Get simulation containers and their status.
+
+    trial_ids narrows the listing to specific trials and status (e.g.
+    "running") is filtered by the daemon, so callers that only need a subset
+    don't pay for a full listing plus Python-side filtering.
+
+    Per-container stats/log fetches run concurrently in worker threads, so
+    wall clock is bound by the slowest daemon call instead of the sum.
+    """
     if not docker_client:
         return []
 
-    containers = []
-    for container in docker_client.containers.list(all=True):
-        if container.name.startswith("aquatic-trial-"):
-            trial_id = container.name.replace("aquatic-trial-", "")
+    filters = {"label": "app=aquatic-trial"}
+    if trial_ids is not None:
+        filters["name"] = [f"aquatic-trial-{i}" for i in trial_ids]
+    if status is not None:
+        filters["status"] = status
 
-            # Get container stats
-            status = container.status
-            stats = {}
-            mission_progress = {}
+    raw_containers = await asyncio.to_thread(
+        docker_client.containers.list, all=True, filters=filters
+    )
 
-            if status == "running":
+    # The daemon's name filter matches substrings (aquatic-trial-1 also hits
+    # aquatic-trial-10), so re-check for exact names after the listing
+    if trial_ids is not None:
+        wanted = {f"aquatic-trial-{i}" for i in trial_ids}
+        raw_containers = [c for c in raw_containers if c.name in wanted]
+
+    async def build_entry(container):
+        trial_id = container.name.replace("aquatic-trial-", "")
+
+        # Get container stats
+        container_status = container.status
+        stats = {}
+        mission_progress = {}
+
+        if container_status == "running":
+            # one_shot skips the daemon's second 1s sample; CPU% comes from
+            # the delta against the values we recorded on the previous tick
+            raw_stats, logs = await asyncio.gather(
+                asyncio.to_thread(
+                    docker_client.api.stats, container.id, stream=False, one_shot=True
+                ),
+                asyncio.to_thread(container.logs, tail=50),
+                return_exceptions=True
+            )
+
+            if not isinstance(raw_stats, Exception):
                 try:
-                    raw_stats = container.stats(stream=False)
-                    # Calculate CPU percentage
-                    cpu_delta = raw_stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                                raw_stats['precpu_stats']['cpu_usage']['total_usage']
-                    system_delta = raw_stats['cpu_stats']['system_cpu_usage'] - \
-                                   raw_stats['precpu_stats']['system_cpu_usage']
-                    cpu_percent = (cpu_delta / system_delta) * 100.0 if system_delta > 0 else 0
+                    # Calculate CPU percentage against the previous sample
+                    cpu_total = raw_stats['cpu_stats']['cpu_usage']['total_usage']
+                    system_cpu = raw_stats['cpu_stats']['system_cpu_usage']
+                    prev = _prev_stats.get(container.id)
+                    _prev_stats[container.id] = (cpu_total, system_cpu)
+                    if prev is not None:
+                        cpu_delta = cpu_total - prev[0]
+                        system_delta = system_cpu - prev[1]
+                        cpu_percent = (cpu_delta / system_delta) * 100.0 if system_delta > 0 else 0
+                    else:
+                        cpu_percent = 0
 
                     # Memory usage
                     mem_usage = raw_stats['memory_stats'].get('usage', 0)
@@ -1033,36 +1399,65 @@ def get_simulation_containers():
                 except:
                     pass
 
-                # Get mission progress from logs
+            # Get mission progress from logs
+            if not isinstance(logs, Exception):
                 try:
-                    logs = container.logs(tail=50).decode('utf-8')
                     mission_progress = parse_mission_progress(logs)
                 except:
                     pass
 
-            # Get VNC port
-            vnc_port = None
-            try:
-                ports = container.attrs['NetworkSettings']['Ports']
-                if ports and '6080/tcp' in ports and ports['6080/tcp']:
-                    vnc_port = ports['6080/tcp'][0]['HostPort']
-            except:
-                pass
+        # Get VNC port
+        vnc_port = None
+        try:
+            ports = container.attrs['NetworkSettings']['Ports']
+            if ports and '6080/tcp' in ports and ports['6080/tcp']:
+                vnc_port = ports['6080/tcp'][0]['HostPort']
+        except:
+            pass
 
-            containers.append({
-                "name": container.name,
-                "trial_id": trial_id,
-                "status": status,
-                "vnc_port": vnc_port,
-                "stats": stats,
-                "mission": mission_progress,
-                "created": container.attrs['Created']
-            })
+        return {
+            "name": container.name,
+            "trial_id": trial_id,
+            "status": container_status,
+            "vnc_port": vnc_port,
+            "stats": stats,
+            "mission": mission_progress,
+            "created": container.attrs['Created']
+        }
+
+    containers = list(await asyncio.gather(*[build_entry(c) for c in raw_containers]))
+
+    # Drop samples for containers that no longer exist (full listings only,
+    # so filtered calls don't evict entries for containers they didn't see)
+    if trial_ids is None and status is None:
+        live_ids = {c.id for c in raw_containers}
+        for cid in list(_prev_stats):
+            if cid not in live_ids:
+                del _prev_stats[cid]
 
     return sorted(containers, key=lambda x: int(x["trial_id"]) if x["trial_id"].isdigit() else 0)
 
-def get_system_stats():
-    """Get system resource usage"""
+# NVML is a shared-library call (microseconds) vs nvidia-smi's ~150ms
+# fork+exec; fall back to the subprocess when the binding isn't available
+try:
+    import pynvml
+    pynvml.nvmlInit()
+    _nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+except Exception:
+    pynvml = None
+    _nvml_handle = None
+
+# GPU sample shared by all WebSocket clients with a short TTL, so M clients
+# polling every 2s cost one sample per TTL instead of M
+_gpu_cache = {"t": 0.0, "val": None}
+_GPU_CACHE_TTL = 1.5
+
+async def get_system_stats():
+    """Get system resource usage.
+
+    CPU/memory sampling (psutil blocks ~100ms) and the GPU sample run
+    in worker threads, in parallel, so neither stalls the event loop.
+    """
     stats = {
         "cpu_percent": 0,
         "memory_percent": 0,
@@ -1071,40 +1466,72 @@ def get_system_stats():
         "gpu": None
     }
 
-    # CPU and Memory
-    try:
-        import psutil
-        stats["cpu_percent"] = psutil.cpu_percent(interval=0.1)
-        mem = psutil.virtual_memory()
+    def sample_cpu_mem():
+        if psutil is None:
+            return None
+        return psutil.cpu_percent(interval=0.1), psutil.virtual_memory()
+
+    def sample_gpu():
+        now = time.monotonic()
+        if now - _gpu_cache["t"] < _GPU_CACHE_TTL:
+            return _gpu_cache["val"]
+
+        gpu = None
+        if _nvml_handle is not None:
+            try:
+                util = pynvml.nvmlDeviceGetUtilizationRates(_nvml_handle)
+                mem = pynvml.nvmlDeviceGetMemoryInfo(_nvml_handle)
+                name = pynvml.nvmlDeviceGetName(_nvml_handle)
+                gpu = {
+                    "utilization": util.gpu,
+                    "memory_used_mb": int(mem.used / 1024 / 1024),
+                    "memory_total_mb": int(mem.total / 1024 / 1024),
+                    "name": name.decode() if isinstance(name, bytes) else name
+                }
+            except Exception:
+                gpu = None
+
+        if gpu is None:
+            try:
+                result = subprocess.run(
+                    ['nvidia-smi', '--query-gpu=utilization.gpu,memory.used,memory.total,name', '--format=csv,noheader,nounits'],
+                    capture_output=True, text=True, timeout=5
+                )
+                if result.returncode == 0:
+                    parts = result.stdout.strip().split(', ')
+                    if len(parts) >= 4:
+                        gpu = {
+                            "utilization": int(parts[0]),
+                            "memory_used_mb": int(parts[1]),
+                            "memory_total_mb": int(parts[2]),
+                            "name": parts[3]
+                        }
+            except:
+                pass
+
+        _gpu_cache["t"] = now
+        _gpu_cache["val"] = gpu
+        return gpu
+
+    cpu_mem, gpu = await asyncio.gather(
+        asyncio.to_thread(sample_cpu_mem),
+        asyncio.to_thread(sample_gpu)
+    )
+
+    if cpu_mem is not None:
+        cpu_percent, mem = cpu_mem
+        stats["cpu_percent"] = cpu_percent
         stats["memory_percent"] = mem.percent
         stats["memory_used_gb"] = round(mem.used / 1024 / 1024 / 1024, 1)
         stats["memory_total_gb"] = round(mem.total / 1024 / 1024 / 1024, 1)
-    except ImportError:
-        pass
 
-    # GPU
-    try:
-        result = subprocess.run(
-            ['nvidia-smi', '--query-gpu=utilization.gpu,memory.used,memory.total,name', '--format=csv,noheader,nounits'],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            parts = result.stdout.strip().split(', ')
-            if len(parts) >= 4:
-                stats["gpu"] = {
-                    "utilization": int(parts[0]),
-                    "memory_used_mb": int(parts[1]),
-                    "memory_total_mb": int(parts[2]),
-                    "name": parts[3]
-                }
-    except:
-        pass
+    stats["gpu"] = gpu
 
     return stats
 
 def start_single_trial(trial_id: int):
     """Start a single simulation trial"""
-    host_data_dir = os.path.expanduser("~/workspaces/aquatic-mapping/src/sampling/data/missions")
+    host_data_dir = MISSIONS_DIR
     container_name = f"aquatic-trial-{trial_id}"
     domain_id = trial_id % 100
     novnc_port = 6080 + trial_id
@@ -1133,6 +1560,10 @@ def start_single_trial(trial_id: int):
             "ROS_DOMAIN_ID": str(domain_id),
             "HEADLESS": "1"
         },
+        labels={
+            "app": "aquatic-trial",
+            "trial_id": str(trial_id)
+        },
         volumes={
             host_data_dir: {"bind": "/home/simuser/aquatic-mapping/src/sampling/data/missions", "mode": "rw"}
         },
@@ -1149,4 +1580,11 @@ def start_single_trial(trial_id: int):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools swap in the C event loop and HTTP parser
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools"
+    )
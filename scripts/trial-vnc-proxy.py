@@ -7,9 +7,12 @@ Routes trialX.bharathdesikan.com to localhost:608X
 import re
 import asyncio
 import aiohttp
+import uvloop
 from aiohttp import web, WSMsgType
 import logging
 
+uvloop.install()
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("trial-proxy")
 
@@ -35,21 +38,26 @@ async def proxy_handler(request):
 
     logger.info(f"Proxying trial {trial_num} -> localhost:{target_port}")
 
+    session = request.app['session']
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method=request.method,
-                url=target_url,
-                headers={k: v for k, v in request.headers.items() if k.lower() not in ('host', 'content-length')},
-                data=await request.read() if request.body_exists else None,
-                allow_redirects=False
-            ) as resp:
-                body = await resp.read()
-                return web.Response(
-                    body=body,
-                    status=resp.status,
-                    headers={k: v for k, v in resp.headers.items() if k.lower() not in ('content-encoding', 'transfer-encoding', 'content-length')}
-                )
+        async with session.request(
+            method=request.method,
+            url=target_url,
+            headers={k: v for k, v in request.headers.items() if k.lower() not in ('host', 'content-length')},
+            data=request.content if request.body_exists else None,
+            allow_redirects=False
+        ) as resp:
+            # Relay the upstream body chunk by chunk - constant memory and
+            # the client sees the first bytes before the backend finishes
+            out = web.StreamResponse(
+                status=resp.status,
+                headers={k: v for k, v in resp.headers.items() if k.lower() not in ('content-encoding', 'transfer-encoding', 'content-length', 'connection')}
+            )
+            await out.prepare(request)
+            async for chunk in resp.content.iter_chunked(64 * 1024):
+                await out.write(chunk)
+            await out.write_eof()
+            return out
     except aiohttp.ClientConnectorError:
         return web.Response(
             text=f"Trial {trial_num} VNC not running (port {target_port})",
@@ -71,39 +79,60 @@ async def websocket_handler(request):
     ws_client = web.WebSocketResponse()
     await ws_client.prepare(request)
 
+    session = request.app['session']
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.ws_connect(target_ws_url) as ws_server:
-                async def forward_to_server():
-                    async for msg in ws_client:
-                        if msg.type == WSMsgType.BINARY:
-                            await ws_server.send_bytes(msg.data)
-                        elif msg.type == WSMsgType.TEXT:
-                            await ws_server.send_str(msg.data)
-                        elif msg.type == WSMsgType.CLOSE:
-                            await ws_server.close()
-                            break
-
-                async def forward_to_client():
-                    async for msg in ws_server:
-                        if msg.type == WSMsgType.BINARY:
-                            await ws_client.send_bytes(msg.data)
-                        elif msg.type == WSMsgType.TEXT:
-                            await ws_client.send_str(msg.data)
-                        elif msg.type == WSMsgType.CLOSE:
-                            await ws_client.close()
-                            break
-
-                await asyncio.gather(forward_to_server(), forward_to_client())
+        async with session.ws_connect(target_ws_url) as ws_server:
+            # This is the hot path - framebuffer frames at ~60Hz. Bound send
+            # methods are cached so each frame costs one branch plus one await
+            # instead of an attribute lookup and a WSMsgType chain
+            async def forward_to_server():
+                send_bytes = ws_server.send_bytes
+                send_str = ws_server.send_str
+                async for msg in ws_client:
+                    t = msg.type
+                    if t == WSMsgType.BINARY:
+                        await send_bytes(msg.data)
+                    elif t == WSMsgType.TEXT:
+                        await send_str(msg.data)
+                    else:
+                        await ws_server.close()
+                        break
+
+            async def forward_to_client():
+                send_bytes = ws_client.send_bytes
+                send_str = ws_client.send_str
+                async for msg in ws_server:
+                    t = msg.type
+                    if t == WSMsgType.BINARY:
+                        await send_bytes(msg.data)
+                    elif t == WSMsgType.TEXT:
+                        await send_str(msg.data)
+                    else:
+                        await ws_client.close()
+                        break
+
+            await asyncio.gather(forward_to_server(), forward_to_client())
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
 
     return ws_client
 
+async def _startup(app):
+    # One shared session with keep-alive to the local noVNC backends instead
+    # of a fresh TCP connect per proxied request
+    app['session'] = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=0, limit_per_host=64, keepalive_timeout=30)
+    )
+
+async def _cleanup(app):
+    await app['session'].close()
+
 def create_app():
     app = web.Application()
     app.router.add_route('GET', '/websockify', websocket_handler)
     app.router.add_route('*', '/{path:.*}', proxy_handler)
+    app.on_startup.append(_startup)
+    app.on_cleanup.append(_cleanup)
     return app
 
 if __name__ == '__main__':